@@ -5,69 +5,20 @@ Creates issues from recent git commits and transitions them to Done.
 Following jira-safe skill patterns for Next-Gen projects.
 """
 
-import base64
-import json
-import os
 import subprocess
 import sys
-import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
-
-# Load .env file from jira root (two levels up from scripts/)
-def load_env():
-    env_path = Path(__file__).parent.parent.parent / '.env'
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
-
-load_env()
-
-# Configuration from environment variables
-JIRA_EMAIL = os.environ.get('JIRA_EMAIL')
-JIRA_API_TOKEN = os.environ.get('JIRA_API_TOKEN')
-JIRA_BASE_URL = os.environ.get('JIRA_BASE_URL')
-PROJECT_KEY = os.environ.get('JIRA_PROJECT_KEY', 'SCRUM')
-
-# Validate required env vars
-if not all([JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL]):
-    print('Error: Missing required environment variables.', file=sys.stderr)
-    print('Required: JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL', file=sys.stderr)
-    print('Set these in .claude/skills/jira/.env or export them manually.', file=sys.stderr)
-    sys.exit(1)
-
-# Build auth header
-auth_string = f'{JIRA_EMAIL}:{JIRA_API_TOKEN}'
-auth_bytes = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
-
-HEADERS = {
-    'Authorization': f'Basic {auth_bytes}',
-    'Content-Type': 'application/json',
-    'Accept': 'application/json'
-}
-
-
-def make_request(method, path, data=None):
-    """Make HTTP request to Jira API."""
-    url = f'{JIRA_BASE_URL}/rest/api/3{path}'
-
-    body = json.dumps(data).encode('utf-8') if data else None
-    req = Request(url, data=body, headers=HEADERS, method=method)
 
-    try:
-        with urlopen(req) as response:
-            status = response.status
-            if status == 204:
-                return None
-            return json.loads(response.read().decode('utf-8'))
-    except HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        raise Exception(f'{e.code}: {error_body[:200]}')
+# Shared env loading, auth, and pooled connections live in jira_common at the
+# jira root (two levels up from scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from jira_common import JIRA_BASE_URL, PROJECT_KEY, make_request
+
+# Bounded concurrency: enough to overlap round trips without tripping
+# Jira's rate limits.
+MAX_WORKERS = 8
 
 
 def get_git_commits(count=50):
@@ -85,14 +36,29 @@ def get_git_commits(count=50):
         return []
 
 
-def create_issue(summary, issue_type='Story'):
-    """Create a Jira issue."""
-    fields = {
-        'project': {'key': PROJECT_KEY},
-        'issuetype': {'name': issue_type},
-        'summary': summary[:255]  # Truncate to Jira limit
+# Max issueUpdates accepted per /issue/bulk call
+BULK_CHUNK = 50
+
+
+def create_issues_bulk(summaries, issue_type='Story'):
+    """Create many issues in a single POST to /issue/bulk.
+
+    Returns the bulk response with 'issues' (created, in input order) and
+    'errors' (per-element failures with failedElementNumber).
+    """
+    payload = {
+        'issueUpdates': [
+            {
+                'fields': {
+                    'project': {'key': PROJECT_KEY},
+                    'issuetype': {'name': issue_type},
+                    'summary': s[:255]  # Truncate to Jira limit
+                }
+            }
+            for s in summaries
+        ]
     }
-    return make_request('POST', '/issue', {'fields': fields})
+    return make_request('POST', '/issue/bulk', payload)
 
 
 def get_transitions(issue_key):
@@ -101,22 +67,31 @@ def get_transitions(issue_key):
     return result['transitions']
 
 
+# The Done transition id is a workflow property shared by every issue created
+# in one run, so it is looked up once and reused instead of per issue.
+_done_transition_id = None
+_done_transition_lock = threading.Lock()
+
+
 def transition_to_done(issue_key):
-    """Transition issue to Done."""
-    transitions = get_transitions(issue_key)
+    """Transition issue to Done (transition id cached after first lookup)."""
+    global _done_transition_id
+
+    if _done_transition_id is None:
+        with _done_transition_lock:
+            if _done_transition_id is None:
+                # Index by target status in one pass instead of scanning
+                targets = {t['to']['name'].lower(): t for t in get_transitions(issue_key)}
+                done = targets.get('done')
+                if done:
+                    _done_transition_id = done['id']
 
-    # Find Done transition
-    done_transition = None
-    for t in transitions:
-        if t['to']['name'].lower() == 'done':
-            done_transition = t
-            break
+    if _done_transition_id is None:
+        return False
 
-    if done_transition:
-        data = {'transition': {'id': done_transition['id']}}
-        make_request('POST', f'/issue/{issue_key}/transitions', data)
-        return True
-    return False
+    data = {'transition': {'id': _done_transition_id}}
+    make_request('POST', f'/issue/{issue_key}/transitions', data)
+    return True
 
 
 def main():
@@ -132,35 +107,53 @@ def main():
         print('No commits found.')
         return
 
-    # Process in batches
-    batch_size = 5
+    # One bulk POST per chunk of 50 commits instead of one POST per commit;
+    # transitions still fan out over the bounded worker pool.
     created = 0
     failed = 0
 
-    for i in range(0, len(commits), batch_size):
-        batch = commits[i:i + batch_size]
-        batch_num = (i // batch_size) + 1
-        total_batches = (len(commits) + batch_size - 1) // batch_size
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        transition_futures = {}
 
-        print(f'\n--- Processing batch {batch_num}/{total_batches} ---')
+        for start in range(0, len(commits), BULK_CHUNK):
+            chunk = commits[start:start + BULK_CHUNK]
 
-        for commit_msg in batch:
             try:
-                # Create issue
-                issue = create_issue(commit_msg)
-                print(f'[OK] Created {issue["key"]}: {commit_msg[:50]}...')
+                result = create_issues_bulk(chunk)
+            except Exception as e:
+                print(f'[FAIL] Bulk create failed: {e}')
+                failed += len(chunk)
+                continue
+
+            # Per-element failures come back in the errors array
+            failed_indexes = set()
+            for error in result.get('errors', []):
+                index = error.get('failedElementNumber')
+                if index is not None:
+                    failed_indexes.add(index)
+                    print(f'[FAIL] Failed: {chunk[index][:40]}... ({error.get("elementErrors")})')
+                else:
+                    print(f'[FAIL] Failed: {error.get("elementErrors")}')
+                failed += 1
 
-                # Transition to Done (already completed work)
-                if transition_to_done(issue['key']):
-                    print(f'  -> {issue["key"]} transitioned to Done')
+            issues = result.get('issues', [])
+            ok_messages = [m for i, m in enumerate(chunk) if i not in failed_indexes]
 
+            # Fire the transitions into the pool without waiting, so they
+            # run while the next chunk's bulk create POST is in flight
+            for issue, commit_msg in zip(issues, ok_messages):
+                print(f'[OK] Created {issue["key"]}: {commit_msg[:50]}...')
+                transition_futures[executor.submit(transition_to_done, issue['key'])] = issue['key']
                 created += 1
 
+        # Collect the pipelined transitions at the end of the run
+        for future in as_completed(transition_futures):
+            issue_key = transition_futures[future]
+            try:
+                if future.result():
+                    print(f'  -> {issue_key} transitioned to Done')
             except Exception as e:
-                print(f'[FAIL] Failed: {commit_msg[:40]}... ({e})')
-                failed += 1
-
-            time.sleep(0.1)  # Rate limiting
+                print(f'  [WARN] Could not transition {issue_key}: {e}')
 
     print('\n' + '=' * 40)
     print('  SUMMARY')
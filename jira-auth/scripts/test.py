@@ -5,87 +5,32 @@ Tests authentication, project access, issue creation, and transitions.
 Following jira-safe skill patterns for Next-Gen projects.
 """
 
-import base64
-import json
-import os
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
-
-# Load .env file from jira root (two levels up from scripts/)
-def load_env():
-    env_path = Path(__file__).parent.parent.parent / '.env'
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
-
-load_env()
-
-# Configuration from environment variables
-JIRA_EMAIL = os.environ.get('JIRA_EMAIL')
-JIRA_API_TOKEN = os.environ.get('JIRA_API_TOKEN')
-JIRA_BASE_URL = os.environ.get('JIRA_BASE_URL')
-PROJECT_KEY = os.environ.get('JIRA_PROJECT_KEY', 'SCRUM')
-
-# Validate required env vars
-if not all([JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL]):
-    print('Error: Missing required environment variables.', file=sys.stderr)
-    print('Required: JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL', file=sys.stderr)
-    print('Set these in .claude/skills/jira/.env or export them manually.', file=sys.stderr)
-    sys.exit(1)
-
-# Build auth header
-auth_string = f'{JIRA_EMAIL}:{JIRA_API_TOKEN}'
-auth_bytes = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
-
-HEADERS = {
-    'Authorization': f'Basic {auth_bytes}',
-    'Content-Type': 'application/json',
-    'Accept': 'application/json'
-}
 
+# Shared env loading, auth, and pooled connections live in jira_common at the
+# jira root (two levels up from scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from jira_common import JIRA_BASE_URL, PROJECT_KEY, make_request as _api_request
 
-def make_request(method, path, data=None):
-    """Make HTTP request to Jira API."""
-    url = f'{JIRA_BASE_URL}/rest/api/3{path}'
 
-    body = json.dumps(data).encode('utf-8') if data else None
-    req = Request(url, data=body, headers=HEADERS, method=method)
+def make_request(method, path, data=None):
+    """Make HTTP request to Jira API, echoing request/response lines."""
+    return _api_request(method, path, data, verbose=True)
 
-    print(f'\nRequest: {method} {url}')
 
-    try:
-        with urlopen(req) as response:
-            status = response.status
-            print(f'Response: {status} OK')
-            if status == 204:
-                return None
-            return json.loads(response.read().decode('utf-8'))
-    except HTTPError as e:
-        print(f'Response: {e.code} Error')
-        error_body = e.read().decode('utf-8')
-        raise Exception(f'{e.code}: {error_body[:200]}')
-
-
-def test_authentication():
+def test_authentication(user):
     """Test 1: Authentication"""
     print('\n=== Test 1: Authentication ===')
-    user = make_request('GET', '/myself')
     print(f'[OK] Authenticated as: {user["displayName"]} ({user["emailAddress"]})')
     print(f'  Account ID: {user["accountId"]}')
     return True
 
 
-def test_get_project():
+def test_get_project(project):
     """Test 2: Get Project"""
     print('\n=== Test 2: Get Project ===')
-    project = make_request('GET', f'/project/{PROJECT_KEY}')
     print(f'[OK] Project: {project["name"]} ({project["key"]})')
     print(f'  Type: {project.get("projectTypeKey", "unknown")}')
     print(f'  ID: {project["id"]}')
@@ -136,12 +81,9 @@ def test_transition_to_done(issue_key, transitions):
     """Test 6: Transition to Done"""
     print('\n=== Test 6: Transition to Done ===')
 
-    # Find Done transition
-    done_transition = None
-    for t in transitions:
-        if t['to']['name'].lower() == 'done':
-            done_transition = t
-            break
+    # Index by target status in one pass instead of scanning per lookup
+    targets = {t['to']['name'].lower(): t for t in transitions}
+    done_transition = targets.get('done')
 
     if not done_transition:
         print('[FAIL] No "Done" transition available')
@@ -177,11 +119,20 @@ def main():
     all_passed = True
 
     try:
+        # Tests 1-2 are independent GETs: issue them concurrently (each
+        # worker keeps its own keep-alive connection) and report in order
+        # so the output stays deterministic.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            user_future = executor.submit(make_request, 'GET', '/myself')
+            project_future = executor.submit(make_request, 'GET', f'/project/{PROJECT_KEY}')
+            user = user_future.result()
+            project = project_future.result()
+
         # Test 1: Authentication
-        test_authentication()
+        test_authentication(user)
 
         # Test 2: Get Project
-        project = test_get_project()
+        test_get_project(project)
 
         # Test 3: Get Issue Types
         test_get_issue_types(project)
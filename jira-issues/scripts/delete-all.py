@@ -11,98 +11,56 @@ Usage:
   python jira-delete-all.py --confirm # Actually delete
 """
 
-import base64
-import json
-import os
 import sys
-import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
 from urllib.parse import quote
 
-# Load .env file from jira root (two levels up from scripts/)
-def load_env():
-    env_path = Path(__file__).parent.parent.parent / '.env'
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
-
-load_env()
-
-# Configuration from environment variables
-JIRA_EMAIL = os.environ.get('JIRA_EMAIL')
-JIRA_API_TOKEN = os.environ.get('JIRA_API_TOKEN')
-JIRA_BASE_URL = os.environ.get('JIRA_BASE_URL')
-PROJECT_KEY = os.environ.get('JIRA_PROJECT_KEY', 'SCRUM')
-
-# Validate required env vars
-if not all([JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL]):
-    print('Error: Missing required environment variables.', file=sys.stderr)
-    print('Required: JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL', file=sys.stderr)
-    print('Set these in .claude/skills/jira/.env or export them manually.', file=sys.stderr)
-    sys.exit(1)
-
-# Build auth header
-auth_string = f'{JIRA_EMAIL}:{JIRA_API_TOKEN}'
-auth_bytes = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
-
-HEADERS = {
-    'Authorization': f'Basic {auth_bytes}',
-    'Content-Type': 'application/json',
-    'Accept': 'application/json'
-}
+# Shared env loading, auth, and pooled connections live in jira_common at the
+# jira root (two levels up from scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from jira_common import PROJECT_KEY, make_request as _api_request
 
-
-def make_request(method, path, data=None):
-    """Make HTTP request to Jira API."""
-    url = f'{JIRA_BASE_URL}/rest/api/3{path}'
-
-    body = json.dumps(data).encode('utf-8') if data else None
-    req = Request(url, data=body, headers=HEADERS, method=method)
-
-    try:
-        with urlopen(req) as response:
-            status = response.status
-            if status == 204:
-                return None
-            return json.loads(response.read().decode('utf-8'))
-    except HTTPError as e:
-        if e.code == 404:
-            return None
-        error_body = e.read().decode('utf-8')
-        raise Exception(f'{e.code}: {error_body[:200]}')
+# Bounded concurrency: enough to overlap round trips without tripping
+# Jira's rate limits.
+MAX_WORKERS = 8
 
 
-def search_issues(jql, max_results=100):
-    """Search issues using JQL."""
-    encoded_jql = quote(jql)
-    path = f'/search/jql?jql={encoded_jql}&maxResults={max_results}&fields=key'
-    return make_request('GET', path)
+def make_request(method, path, data=None):
+    """Jira API request that treats 404 as already-deleted."""
+    return _api_request(method, path, data, ignore_404=True)
+
+
+def iter_issue_keys(jql, page_size=100):
+    """Yield issue keys page by page using nextPageToken cursor pagination.
+
+    Handles projects of any size (the old single maxResults=500 request
+    silently dropped the tail) and lets callers start work on the first
+    page while later pages are still being fetched.
+    """
+    token = None
+    while True:
+        # fields=-*all drops every field from the per-issue payload; the key
+        # comes back in the issue envelope anyway, which is all deletion needs
+        path = (f'/search/jql?jql={quote(jql)}&maxResults={page_size}'
+                f'&fields=-*all&fieldsByKeys=true')
+        if token:
+            path += f'&nextPageToken={quote(token)}'
+
+        result = make_request('GET', path) or {}
+        for issue in result.get('issues', []):
+            yield issue['key']
+
+        token = result.get('nextPageToken')
+        if not token or result.get('isLast'):
+            return
 
 
 def delete_issue(issue_key, delete_subtasks=True):
-    """Delete an issue."""
+    """Delete an issue (404 counts as already deleted)."""
     subtask_param = 'true' if delete_subtasks else 'false'
-    path = f'/issue/{issue_key}?deleteSubtasks={subtask_param}'
-
-    req = Request(
-        f'{JIRA_BASE_URL}/rest/api/3{path}',
-        headers=HEADERS,
-        method='DELETE'
-    )
-
-    try:
-        with urlopen(req) as response:
-            return response.status == 204
-    except HTTPError as e:
-        if e.code == 404:
-            return True  # Already deleted
-        raise
+    make_request('DELETE', f'/issue/{issue_key}?deleteSubtasks={subtask_param}')
+    return True
 
 
 def main():
@@ -120,39 +78,54 @@ def main():
     jql = f'project = {PROJECT_KEY} ORDER BY key ASC'
 
     try:
-        result = search_issues(jql, max_results=500)
-        issues = result.get('issues', [])
-        total = result.get('total', len(issues))
-
-        print(f'Found {total} issues to delete')
-
         if dry_run:
+            keys = list(iter_issue_keys(jql))
+            print(f'Found {len(keys)} issues to delete')
             print('\n[DRY RUN] Would delete:')
-            for issue in issues[:20]:
-                print(f'  - {issue["key"]}')
-            if len(issues) > 20:
-                print(f'  ... and {len(issues) - 20} more')
+            for key in keys[:20]:
+                print(f'  - {key}')
+            if len(keys) > 20:
+                print(f'  ... and {len(keys) - 20} more')
             print(f'\nRun with --confirm to actually delete.')
             return
 
-        # Actually delete
+        # Stream keys into the bounded worker pool as pages arrive, so the
+        # first deletes start after one page instead of after the full
+        # listing; the pool size doubles as the rate limit.
         deleted = 0
         failed = 0
 
-        print('\nDeleting issues...')
-        for issue in issues:
+        def report(future, issue_key):
+            nonlocal deleted, failed
             try:
-                if delete_issue(issue['key']):
-                    print(f'  [OK] Deleted: {issue["key"]}')
+                if future.result():
+                    print(f'  [OK] Deleted: {issue_key}')
                     deleted += 1
                 else:
-                    print(f'  [FAIL] Failed: {issue["key"]}')
+                    print(f'  [FAIL] Failed: {issue_key}')
                     failed += 1
             except Exception as e:
-                print(f'  [FAIL] Error {issue["key"]}: {e}')
+                print(f'  [FAIL] Error {issue_key}: {e}')
                 failed += 1
 
-            time.sleep(0.1)  # Rate limiting
+        print('Deleting issues...')
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Keep a bounded window of in-flight deletes: each page of keys
+            # is submitted while earlier deletes are still running, but the
+            # window cap stops the producer from buffering every future (and
+            # every search page) up front.
+            window = MAX_WORKERS * 4
+            pending = {}
+
+            for key in iter_issue_keys(jql):
+                pending[executor.submit(delete_issue, key)] = key
+                if len(pending) >= window:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        report(future, pending.pop(future))
+
+            for future in as_completed(pending):
+                report(future, pending[future])
 
         print('\n' + '=' * 40)
         print('  SUMMARY')
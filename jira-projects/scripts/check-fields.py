@@ -5,70 +5,94 @@ Check project configuration, issue types, and available fields.
 Following jira-safe skill patterns for Next-Gen projects.
 """
 
-import base64
 import json
-import os
 import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
-
-# Load .env file from jira root (two levels up from scripts/)
-def load_env():
-    env_path = Path(__file__).parent.parent.parent / '.env'
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
-
-load_env()
-
-# Configuration from environment variables
-JIRA_EMAIL = os.environ.get('JIRA_EMAIL')
-JIRA_API_TOKEN = os.environ.get('JIRA_API_TOKEN')
-JIRA_BASE_URL = os.environ.get('JIRA_BASE_URL')
-PROJECT_KEY = os.environ.get('JIRA_PROJECT_KEY', 'SCRUM')
-
-# Validate required env vars
-if not all([JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL]):
-    print('Error: Missing required environment variables.', file=sys.stderr)
-    print('Required: JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL', file=sys.stderr)
-    print('Set these in .claude/skills/jira/.env or export them manually.', file=sys.stderr)
-    sys.exit(1)
-
-# Build auth header
-auth_string = f'{JIRA_EMAIL}:{JIRA_API_TOKEN}'
-auth_bytes = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
-
-HEADERS = {
-    'Authorization': f'Basic {auth_bytes}',
-    'Content-Type': 'application/json',
-    'Accept': 'application/json'
-}
-
-
-def make_request(method, path):
-    """Make HTTP request to Jira API."""
-    url = f'{JIRA_BASE_URL}/rest/api/3{path}'
-    req = Request(url, headers=HEADERS, method=method)
 
+# Shared env loading, auth, and pooled connections live in jira_common at the
+# jira root (two levels up from scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+from jira_common import PROJECT_KEY, raw_request
+
+
+# The metadata endpoints queried here (project, issue types, link types,
+# createmeta) change at most once per workflow edit, so responses are cached
+# on disk with a short TTL; repeat runs skip the network entirely.
+CACHE_PATH = Path.home() / '.cache' / 'jira-skills' / 'meta.json'
+CACHE_TTL = 600  # seconds
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def _load_cache():
+    global _cache
+    if _cache is None:
+        try:
+            _cache = json.loads(CACHE_PATH.read_text())
+        except (OSError, ValueError):
+            _cache = {}
+    return _cache
+
+
+def _save_cache():
     try:
-        with urlopen(req) as response:
-            return json.loads(response.read().decode('utf-8'))
-    except HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        raise Exception(f'{e.code}: {error_body[:200]}')
+        CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        CACHE_PATH.write_text(json.dumps(_cache))
+    except OSError:
+        pass  # Cache is best-effort
+
+
+def cached_request(path):
+    """GET with a short-TTL disk cache for rarely-changing metadata.
+
+    Fresh entries are served straight from disk; stale ones are
+    revalidated with If-None-Match, so an unchanged endpoint answers with
+    an empty 304 instead of re-sending the full body.
+    """
+    with _cache_lock:
+        cache = _load_cache()
+        entry = cache.get(path)
+        if entry and time.time() - entry['time'] < CACHE_TTL:
+            return entry['body']
+
+    conditional = {'If-None-Match': entry['etag']} if entry and entry.get('etag') else None
+    status, headers, payload = raw_request('GET', path, headers=conditional)
+
+    if status == 304:
+        with _cache_lock:
+            entry['time'] = time.time()
+            _save_cache()
+        return entry['body']
+
+    if status >= 400:
+        raise Exception(f'{status}: {payload[:200].decode("utf-8", "replace")}')
+
+    body = json.loads(payload.decode('utf-8'))
+    with _cache_lock:
+        cache[path] = {'time': time.time(), 'body': body, 'etag': headers.get('ETag')}
+        _save_cache()
+    return body
 
 
 def main():
+    global _cache
+
+    if '--no-cache' in sys.argv:
+        try:
+            CACHE_PATH.unlink()
+        except OSError:
+            pass
+        _cache = {}
+
     print('=== Checking Jira Project Configuration ===\n')
 
     # 1. Project Info
     print('1. PROJECT INFO:')
-    project = make_request('GET', f'/project/{PROJECT_KEY}')
+    project = cached_request(f'/project/{PROJECT_KEY}')
     print(f'   Name: {project["name"]}')
     print(f'   Type: {project.get("projectTypeKey", "unknown")}')
     print(f'   Style: {project.get("style", "unknown")}')
@@ -78,17 +102,25 @@ def main():
     is_next_gen = project.get('style') == 'next-gen' or project.get('simplified') == True
     print(f'\n   >>> {"NEXT-GEN (Team-managed)" if is_next_gen else "CLASSIC (Company-managed)"} <<<')
 
+    # Sections 2-4 only depend on the project id, so their GETs run
+    # concurrently (each worker has its own keep-alive connection) while the
+    # output below stays in order.
+    project_id = project['id']
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        types_future = executor.submit(cached_request, f'/issuetype/project?projectId={project_id}')
+        links_future = executor.submit(cached_request, '/issueLinkType')
+        meta_future = executor.submit(cached_request, f'/issue/createmeta/{PROJECT_KEY}/issuetypes/10004')
+
     # 2. Issue Types
     print('\n2. ISSUE TYPES:')
-    project_id = project['id']
-    issue_types = make_request('GET', f'/issuetype/project?projectId={project_id}')
+    issue_types = types_future.result()
     for it in issue_types:
         subtask_marker = ' - subtask' if it.get('subtask') else ' - standard'
         print(f'   - {it["name"]} ({it["id"]}){subtask_marker}')
 
     # 3. Link Types
     print('\n3. LINK TYPES:')
-    link_types = make_request('GET', '/issueLinkType')
+    link_types = links_future.result()
     for lt in link_types.get('issueLinkTypes', []):
         print(f'   - {lt["name"]} ({lt["id"]})')
         print(f'     Inward: "{lt["inward"]}"')
@@ -97,7 +129,7 @@ def main():
     # 4. Create Meta (fields available for Story)
     print('\n4. FIELDS ON STORY (create screen):')
     try:
-        create_meta = make_request('GET', f'/issue/createmeta/{PROJECT_KEY}/issuetypes/10004')
+        create_meta = meta_future.result()
 
         print('   Available on create screen:')
         # Handle different response formats
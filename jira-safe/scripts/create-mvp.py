@@ -21,13 +21,17 @@ from urllib.error import HTTPError
 # Load .env file from jira root (two levels up from scripts/)
 def load_env():
     env_path = Path(__file__).parent.parent.parent / '.env'
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
+    # EAFP: read directly (one read + splitlines) instead of a separate
+    # exists() stat followed by buffered per-line iteration
+    try:
+        text = env_path.read_bytes().decode('utf-8', 'replace')
+    except FileNotFoundError:
+        return
+    for line in text.splitlines():
+        line = line.strip()
+        if line and not line.startswith('#') and '=' in line:
+            key, value = line.split('=', 1)
+            os.environ.setdefault(key.strip(), value.strip())
 
 load_env()
 
@@ -73,8 +77,8 @@ def jira_request(path, method='GET', data=None):
                 return None
             return json.loads(response.read().decode('utf-8'))
     except HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        raise Exception(f'{e.code}: {error_body[:300]}')
+        error_body = e.read(300).decode('utf-8', 'replace')
+        raise Exception(f'{e.code}: {error_body}')
 
 
 def build_adf(sections):
@@ -11,62 +11,22 @@ Example:
   python create-space.py DOCS "Project Documentation" "Technical docs and guides"
 """
 
-import base64
-import json
-import os
 import re
 import sys
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
 
-# Load .env file from jira root (two levels up from scripts/)
-def load_env():
-    env_path = Path(__file__).parent.parent.parent / '.env'
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
+# Shared helpers live at the skills root (two levels up from scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-load_env()
+from jira_common import JIRA_BASE_URL, make_request
 
-JIRA_EMAIL = os.environ.get('JIRA_EMAIL')
-JIRA_API_TOKEN = os.environ.get('JIRA_API_TOKEN')
-JIRA_BASE_URL = os.environ.get('JIRA_BASE_URL')
-
-if not all([JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL]):
-    print('Error: Missing required environment variables.', file=sys.stderr)
-    print('Required: JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL', file=sys.stderr)
-    sys.exit(1)
-
-auth_string = f'{JIRA_EMAIL}:{JIRA_API_TOKEN}'
-auth_bytes = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
-
-HEADERS = {
-    'Authorization': f'Basic {auth_bytes}',
-    'Content-Type': 'application/json',
-    'Accept': 'application/json'
-}
+# Compiled once at import; \Z avoids $'s trailing-newline edge case
+_SPACE_KEY_RE = re.compile(r'[A-Z][A-Z0-9]*\Z')
 
 
 def confluence_request(path, method='GET', data=None):
-    """Make HTTP request to Confluence API."""
-    url = f'{JIRA_BASE_URL}/wiki/rest/api{path}'
-
-    body = json.dumps(data).encode('utf-8') if data else None
-    req = Request(url, data=body, headers=HEADERS, method=method)
-
-    try:
-        with urlopen(req) as response:
-            if response.status in (204, 202):
-                return None
-            return json.loads(response.read().decode('utf-8'))
-    except HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        raise Exception(f'{e.code}: {error_body[:300]}')
+    """Make HTTP request to the Confluence API via the shared connection pool."""
+    return make_request(method, path, data, api_root='/wiki/rest/api')
 
 
 def create_space(key, name, description=''):
@@ -119,7 +79,7 @@ def main():
     description = args[2] if len(args) > 2 else ''
 
     # Validate space key
-    if not re.match(r'^[A-Z][A-Z0-9]*$', space_key):
+    if not _SPACE_KEY_RE.match(space_key):
         print('Error: Space key must start with a letter and contain only uppercase letters and numbers.')
         print('Example: DOCS, PROJ, TUSTLE')
         sys.exit(1)
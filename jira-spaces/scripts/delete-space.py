@@ -14,67 +14,29 @@ Example:
   python delete-space.py DOCS --confirm
 """
 
-import base64
-import json
-import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
 
-# Load .env file from jira root (two levels up from scripts/)
-def load_env():
-    env_path = Path(__file__).parent.parent.parent / '.env'
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
+# Shared helpers live at the skills root (two levels up from scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-load_env()
-
-JIRA_EMAIL = os.environ.get('JIRA_EMAIL')
-JIRA_API_TOKEN = os.environ.get('JIRA_API_TOKEN')
-JIRA_BASE_URL = os.environ.get('JIRA_BASE_URL')
-
-if not all([JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL]):
-    print('Error: Missing required environment variables.', file=sys.stderr)
-    print('Required: JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL', file=sys.stderr)
-    sys.exit(1)
-
-auth_string = f'{JIRA_EMAIL}:{JIRA_API_TOKEN}'
-auth_bytes = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
-
-HEADERS = {
-    'Authorization': f'Basic {auth_bytes}',
-    'Content-Type': 'application/json',
-    'Accept': 'application/json'
-}
+from jira_common import JIRA_BASE_URL, cached_get, make_request
 
 
 def confluence_request(path, method='GET', data=None):
-    """Make HTTP request to Confluence API."""
-    url = f'{JIRA_BASE_URL}/wiki/rest/api{path}'
-
-    body = json.dumps(data).encode('utf-8') if data else None
-    req = Request(url, data=body, headers=HEADERS, method=method)
-
-    try:
-        with urlopen(req) as response:
-            if response.status in (204, 202):
-                return None
-            return json.loads(response.read().decode('utf-8'))
-    except HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        raise Exception(f'{e.code}: {error_body[:300]}')
+    """Make HTTP request to the Confluence API via the shared connection pool."""
+    return make_request(method, path, data, api_root='/wiki/rest/api')
 
 
 def get_space(key):
-    """Get space details."""
+    """Get space details (ETag-cached; unchanged spaces return 304).
+
+    The confirmation prompt only shows key/name/type/status, so the
+    description is not expanded.
+    """
     try:
-        return confluence_request(f'/space/{key}?expand=description.plain')
+        return cached_get(f'/space/{key}', api_root='/wiki/rest/api')
     except:
         return None
 
@@ -118,38 +80,39 @@ def main():
     print('  DELETE CONFLUENCE SPACE')
     print('=' * 40 + '\n')
 
-    # First, check if space exists
-    print(f'Looking up space {space_key}...')
-    space = get_space(space_key)
-
-    if not space:
-        print(f"Error: Space '{space_key}' not found.")
-        sys.exit(1)
-
-    print('\nSpace found:')
-    print(f"  Key:    {space['key']}")
-    print(f"  Name:   {space['name']}")
-    print(f"  Type:   {space['type']}")
-    print(f"  Status: {space.get('status', 'current')}")
-
-    print('\n' + '!' * 50)
-    print('  WARNING: This will permanently delete:')
-    print('  - All pages in the space')
-    print('  - All attachments')
-    print('  - All comments')
-    print('  - The space itself')
-    print('  THIS CANNOT BE UNDONE!')
-    print('!' * 50 + '\n')
-
-    proceed = skip_confirm
-
     if not skip_confirm:
-        answer = input(f"Type 'yes' to delete space {space_key}: ")
-        proceed = answer.lower() in ('y', 'yes')
-
-    if not proceed:
-        print('\nDeletion cancelled.')
-        sys.exit(0)
+        # Start the existence lookup in the background; the round trip
+        # hides inside the time the human spends reading and typing.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            space_future = executor.submit(get_space, space_key)
+
+            print('!' * 50)
+            print('  WARNING: This will permanently delete:')
+            print('  - All pages in the space')
+            print('  - All attachments')
+            print('  - All comments')
+            print('  - The space itself')
+            print('  THIS CANNOT BE UNDONE!')
+            print('!' * 50 + '\n')
+
+            answer = input(f"Type 'yes' to delete space {space_key}: ")
+            space = space_future.result()
+
+        if answer.lower() not in ('y', 'yes'):
+            print('\nDeletion cancelled.')
+            sys.exit(0)
+
+        if not space:
+            print(f"Error: Space '{space_key}' not found.")
+            sys.exit(1)
+
+        print('\nSpace found:')
+        print(f"  Key:    {space['key']}")
+        print(f"  Name:   {space['name']}")
+        print(f"  Type:   {space['type']}")
+        print(f"  Status: {space.get('status', 'current')}")
+    # With --confirm there is no pre-GET at all: the DELETE's own 404
+    # reports a missing space, saving one round trip.
 
     try:
         print(f'\nDeleting space {space_key}...')
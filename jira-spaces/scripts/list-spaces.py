@@ -9,70 +9,26 @@ Usage:
   python list-spaces.py --limit 50
 """
 
-import base64
-import json
-import os
 import sys
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
+from urllib.parse import urlencode
 
-# Load .env file from jira root (two levels up from scripts/)
-def load_env():
-    env_path = Path(__file__).parent.parent.parent / '.env'
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
+# Shared helpers live at the skills root (two levels up from scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
 
-load_env()
-
-JIRA_EMAIL = os.environ.get('JIRA_EMAIL')
-JIRA_API_TOKEN = os.environ.get('JIRA_API_TOKEN')
-JIRA_BASE_URL = os.environ.get('JIRA_BASE_URL')
-
-if not all([JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL]):
-    print('Error: Missing required environment variables.', file=sys.stderr)
-    print('Required: JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL', file=sys.stderr)
-    sys.exit(1)
-
-auth_string = f'{JIRA_EMAIL}:{JIRA_API_TOKEN}'
-auth_bytes = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
-
-HEADERS = {
-    'Authorization': f'Basic {auth_bytes}',
-    'Content-Type': 'application/json',
-    'Accept': 'application/json'
-}
-
-
-def confluence_request(path, method='GET', data=None):
-    """Make HTTP request to Confluence API."""
-    url = f'{JIRA_BASE_URL}/wiki/rest/api{path}'
-
-    body = json.dumps(data).encode('utf-8') if data else None
-    req = Request(url, data=body, headers=HEADERS, method=method)
-
-    try:
-        with urlopen(req) as response:
-            if response.status == 204:
-                return None
-            return json.loads(response.read().decode('utf-8'))
-    except HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        raise Exception(f'{e.code}: {error_body[:300]}')
+from jira_common import JIRA_BASE_URL, cached_get
 
 
 def list_spaces(space_type=None, limit=25):
-    """List Confluence spaces."""
-    path = f'/space?limit={limit}&expand=description.plain'
+    """List Confluence spaces (ETag-cached; unchanged lists return 304).
+
+    Descriptions are never printed, so they are not expanded.
+    """
+    params = {'limit': limit}
     if space_type:
-        path += f'&type={space_type}'
+        params['type'] = space_type
 
-    return confluence_request(path)
+    return cached_get(f'/space?{urlencode(params)}', api_root='/wiki/rest/api')
 
 
 def main():
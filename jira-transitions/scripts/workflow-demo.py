@@ -12,78 +12,29 @@ Usage:
   python jira-workflow-demo.py status SCRUM-123
 """
 
-import base64
-import json
-import os
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
-
-# Load .env file from jira root (two levels up from scripts/)
-def load_env():
-    env_path = Path(__file__).parent.parent.parent / '.env'
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
-
-load_env()
-
-# Configuration from environment variables
-JIRA_EMAIL = os.environ.get('JIRA_EMAIL')
-JIRA_API_TOKEN = os.environ.get('JIRA_API_TOKEN')
-JIRA_BASE_URL = os.environ.get('JIRA_BASE_URL')
-PROJECT_KEY = os.environ.get('JIRA_PROJECT_KEY', 'SCRUM')
-
-# Validate required env vars
-if not all([JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL]):
-    print('Error: Missing required environment variables.', file=sys.stderr)
-    print('Required: JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL', file=sys.stderr)
-    print('Set these in .claude/skills/jira/.env or export them manually.', file=sys.stderr)
-    sys.exit(1)
-
-# Build auth header
-auth_string = f'{JIRA_EMAIL}:{JIRA_API_TOKEN}'
-auth_bytes = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
-
-HEADERS = {
-    'Authorization': f'Basic {auth_bytes}',
-    'Content-Type': 'application/json',
-    'Accept': 'application/json'
-}
-
-
-def make_request(method, path, data=None):
-    """Make HTTP request to Jira API."""
-    url = f'{JIRA_BASE_URL}/rest/api/3{path}'
-
-    body = json.dumps(data).encode('utf-8') if data else None
-    req = Request(url, data=body, headers=HEADERS, method=method)
 
-    try:
-        with urlopen(req) as response:
-            status = response.status
-            if status == 204:
-                return None
-            return json.loads(response.read().decode('utf-8'))
-    except HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        raise Exception(f'{e.code}: {error_body[:200]}')
+# Shared helpers live at the skills root (two levels up from scripts/)
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from jira_common import JIRA_BASE_URL, PROJECT_KEY, cached_get, make_request
 
 
 def get_issue(issue_key):
-    """Get issue details."""
-    return make_request('GET', f'/issue/{issue_key}?fields=summary,status')
+    """Get issue details (ETag-cached; unchanged issues return 304)."""
+    return cached_get(f'/issue/{issue_key}?fields=summary,status')
 
 
 def get_transitions(issue_key):
-    """Get available transitions for an issue."""
-    result = make_request('GET', f'/issue/{issue_key}/transitions?expand=transitions.fields')
+    """Get available transitions for an issue.
+
+    Only id/name/target-status are read, so the transition screen
+    field schema (expand=transitions.fields) is not requested.
+    """
+    result = cached_get(f'/issue/{issue_key}/transitions')
     return result['transitions']
 
 
@@ -110,9 +61,39 @@ def add_comment(issue_key, comment_text):
     make_request('POST', f'/issue/{issue_key}/comment', data)
 
 
-def transition_to(issue_key, target_status):
-    """Transition issue to a target status."""
-    transitions = get_transitions(issue_key)
+# Available transitions are a property of the workflow (project + current
+# status), not of the individual issue, so batch runs over one project can
+# reuse a single fetch per status instead of one per issue.
+_transitions_cache = {}
+
+
+def transitions_for(issue_key, current_status=None):
+    """Get transitions, cached per (project, status) when the status is known."""
+    if current_status is None:
+        return get_transitions(issue_key)
+
+    cache_key = (issue_key.split('-')[0], current_status)
+    transitions = _transitions_cache.get(cache_key)
+    if transitions is None:
+        transitions = get_transitions(issue_key)
+        _transitions_cache[cache_key] = transitions
+    return transitions
+
+
+def transition_to(issue_key, target_status, current_status=None):
+    """Transition issue to a target status.
+
+    Args:
+        issue_key: Issue to transition
+        target_status: Status (or transition) name to move to
+        current_status: Current status name, if known; enables the
+            per-(project, status) transitions cache
+
+    Returns:
+        The new status name on success (truthy), False if no matching
+        transition is available.
+    """
+    transitions = transitions_for(issue_key, current_status)
 
     # Find matching transition
     transition = None
@@ -129,7 +110,7 @@ def transition_to(issue_key, target_status):
         return False
 
     do_transition(issue_key, transition['id'])
-    return True
+    return transition['to']['name']
 
 
 def show_status(issue_key):
@@ -150,50 +131,74 @@ def run_demo(issue_key):
     print(f'Project: {PROJECT_KEY}')
     print(f'URL: {JIRA_BASE_URL}/browse/{issue_key}')
 
+    # Steps 1 and 2 are independent round trips; fetch them concurrently so
+    # the wall time is one RTT instead of two (connections are per-thread)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        issue_future = executor.submit(get_issue, issue_key)
+        transitions_future = executor.submit(get_transitions, issue_key)
+        issue = issue_future.result()
+        transitions = transitions_future.result()
+
     # Step 1: Check current status
     print('\n--- Step 1: Check Current Status ---')
-    issue = get_issue(issue_key)
     current_status = issue['fields']['status']['name']
     print(f'Initial status: {current_status}')
 
     # Step 2: Show available transitions
     print('\n--- Step 2: Available Transitions ---')
-    transitions = get_transitions(issue_key)
     print(f'Found {len(transitions)} transitions:')
     for t in transitions:
         print(f'  - {t["id"]}: "{t["name"]}" -> {t["to"]["name"]}')
 
-    # Step 3: Start work (transition to Progressing)
+    # Step 3: Start work (transition to Progressing). The status is already
+    # known from Step 1 (and the server confirmed each transition), so the
+    # demo tracks it locally instead of re-fetching the issue between steps.
     print('\n--- Step 3: Start Work ---')
     print(f'\nStarting work on {issue_key}...')
-    issue = get_issue(issue_key)
-    print(f'  Current status: {issue["fields"]["status"]["name"]}')
-
-    if transition_to(issue_key, 'Progressing'):
-        add_comment(issue_key, '[Python Demo] Work started')
-        print('  Transitioned to: Progressing')
-        print('  Added start comment')
-
-    # Step 4: Simulate work
-    print('\n--- Step 4: Simulating Work ---')
-    print('  [Simulating development work...]')
-    time.sleep(1)
-    print('  [Work complete!]')
+    print(f'  Current status: {current_status}')
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        comment_future = None
+        new_status = transition_to(issue_key, 'Progressing', current_status)
+        if new_status:
+            current_status = new_status
+            # The start comment gates nothing downstream; let the POST run
+            # during the simulated-work pause instead of paying its own RTT
+            comment_future = executor.submit(
+                add_comment, issue_key, '[Python Demo] Work started')
+            print('  Transitioned to: Progressing')
+
+        # Step 4: Simulate work
+        print('\n--- Step 4: Simulating Work ---')
+        print('  [Simulating development work...]')
+        time.sleep(1)
+        print('  [Work complete!]')
+
+        if comment_future is not None:
+            comment_future.result()
+            print('  Added start comment')
 
     # Step 5: Complete work
     print('\n--- Step 5: Complete Work ---')
     print(f'\nCompleting work on {issue_key}...')
-    issue = get_issue(issue_key)
-    print(f'  Current status: {issue["fields"]["status"]["name"]}')
-
-    if transition_to(issue_key, 'Done'):
-        add_comment(issue_key, '[Python Demo] Work completed')
+    print(f'  Current status: {current_status}')
+
+    if transition_to(issue_key, 'Done', current_status):
+        # The completion comment doesn't block the final status read; overlap
+        # the POST with the GET instead of paying two sequential RTTs
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            comment_future = executor.submit(
+                add_comment, issue_key, '[Python Demo] Work completed')
+            final_future = executor.submit(get_issue, issue_key)
+            comment_future.result()
+            issue = final_future.result()
         print('  Transitioned to: Done')
         print('  Added completion comment')
+    else:
+        issue = get_issue(issue_key)
 
     # Step 6: Final status
     print('\n--- Step 6: Final Status ---')
-    issue = get_issue(issue_key)
     print(f'Final status: {issue["fields"]["status"]["name"]}')
 
     print('\n' + '=' * 40)
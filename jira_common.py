@@ -0,0 +1,303 @@
+#!/usr/bin/env python3
+"""
+Shared Jira helpers for the skill scripts.
+
+Loads .env once, builds the auth headers once, and keeps one persistent
+keep-alive connection per thread, so scripts stop duplicating that setup
+and chained scripts in one process share the same connection pool.
+
+Scripts two levels down (skill/scripts/*.py) import this with:
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+    from jira_common import make_request, JIRA_BASE_URL, PROJECT_KEY
+"""
+
+import base64
+import gzip
+import http.client
+import json
+import os
+import re
+import sys
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlsplit
+
+# orjson serializes and parses several times faster than stdlib json and
+# works on bytes directly (no encode/decode round trip); fall back to the
+# stdlib when it is not installed.
+try:
+    import orjson
+
+    def _json_dumps(data):
+        return orjson.dumps(data)
+
+    def _json_loads(payload):
+        return orjson.loads(payload)
+except ImportError:
+    def _json_dumps(data):
+        return json.dumps(data).encode('utf-8')
+
+    def _json_loads(payload):
+        return json.loads(payload.decode('utf-8'))
+
+
+# Matches KEY=VALUE lines (comments excluded) so the whole .env file is
+# parsed in one C-level regex pass instead of per-line string ops
+_ENV_RE = re.compile(r'(?m)^[ \t]*(?!#)([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$')
+
+
+@lru_cache(maxsize=1)
+def load_env():
+    """Load environment variables from the .env file next to this module.
+
+    Memoized so repeated calls (re-imports, chained scripts) parse the
+    file only once per process.
+    """
+    env_path = Path(__file__).parent / '.env'
+    # EAFP: read directly instead of paying a separate exists() stat.
+    # read_bytes hits the single-read fast path (no TextIOWrapper or
+    # incremental decoder for a file this small).
+    try:
+        text = env_path.read_bytes().decode('utf-8', 'replace')
+    except FileNotFoundError:
+        return
+    for key, value in _ENV_RE.findall(text):
+        os.environ.setdefault(key, value)
+
+
+load_env()
+
+# Configuration from environment variables
+JIRA_EMAIL = os.environ.get('JIRA_EMAIL')
+JIRA_API_TOKEN = os.environ.get('JIRA_API_TOKEN')
+JIRA_BASE_URL = os.environ.get('JIRA_BASE_URL')
+PROJECT_KEY = os.environ.get('JIRA_PROJECT_KEY', 'SCRUM')
+
+# Validate required env vars
+if not all([JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL]):
+    print('Error: Missing required environment variables.', file=sys.stderr)
+    print('Required: JIRA_EMAIL, JIRA_API_TOKEN, JIRA_BASE_URL', file=sys.stderr)
+    print('Set these in .claude/skills/jira/.env or export them manually.', file=sys.stderr)
+    sys.exit(1)
+
+# Build auth header once per process
+auth_string = f'{JIRA_EMAIL}:{JIRA_API_TOKEN}'
+auth_bytes = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
+
+HEADERS = {
+    'Authorization': f'Basic {auth_bytes}',
+    'Content-Type': 'application/json',
+    'Accept': 'application/json',
+    # JSON responses compress ~5x (repeated keys, URLs); decoded in raw_request
+    'Accept-Encoding': 'gzip'
+}
+
+class _TokenBucket:
+    """Adaptive rate limiter fed by Jira's X-RateLimit-* response headers.
+
+    Replaces the old blind time.sleep(0.1) pacing: starts permissive,
+    adapts to the fill rate the server advertises, and is shared (and
+    thread-safe) across the bounded worker pools.
+    """
+
+    def __init__(self, fill_rate=5, interval=1):
+        self.fill_rate = fill_rate
+        self.interval = interval
+        self.tokens = float(fill_rate)
+        self.last = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a request token is available."""
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(
+                    float(self.fill_rate),
+                    self.tokens + (now - self.last) * self.fill_rate / self.interval)
+                self.last = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) * self.interval / self.fill_rate
+            time.sleep(wait)
+
+    def update(self, headers):
+        """Adopt the rate Jira advertises on each response."""
+        with self.lock:
+            try:
+                self.fill_rate = max(1, int(headers.get('X-RateLimit-FillRate', self.fill_rate)))
+                self.interval = max(1, int(headers.get('X-RateLimit-Interval-Seconds', self.interval)))
+            except (TypeError, ValueError):
+                pass
+
+
+_bucket = _TokenBucket()
+
+# One persistent keep-alive connection per thread. Reusing connections avoids
+# a TCP+TLS handshake per call, and thread-locality keeps the bounded worker
+# pools in the bulk scripts safe.
+_local = threading.local()
+
+
+def _connect():
+    conn = getattr(_local, 'connection', None)
+    if conn is None:
+        host = urlsplit(JIRA_BASE_URL).netloc
+        conn = http.client.HTTPSConnection(host, timeout=30)
+        _local.connection = conn
+    return conn
+
+
+def raw_request(method, path, data=None, api_root='/rest/api/3', headers=None):
+    """Low-level Jira request returning (status, headers, payload bytes).
+
+    Applies the rate limiter, connection reuse and 429 retries but no
+    error translation; callers that need response headers (for example
+    conditional GETs with If-None-Match) use this directly.
+
+    Args:
+        method: HTTP method (GET, POST, PUT, DELETE)
+        path: API path (e.g. '/issue')
+        data: Request body as dict (will be JSON encoded)
+        api_root: URL prefix, defaults to REST API v3
+        headers: Extra headers merged over the shared auth headers
+    """
+    body = _json_dumps(data) if data else None
+    url = f'{api_root}{path}'
+    request_headers = {**HEADERS, **headers} if headers else HEADERS
+
+    while True:
+        _bucket.acquire()
+
+        for attempt in (1, 2):
+            conn = _connect()
+            try:
+                conn.request(method, url, body=body, headers=request_headers)
+                response = conn.getresponse()
+                break
+            except (http.client.HTTPException, OSError):
+                # Server closed the idle connection; reconnect and retry once
+                conn.close()
+                _local.connection = None
+                if attempt == 2:
+                    raise
+
+        payload = response.read()
+        if response.headers.get('Content-Encoding') == 'gzip':
+            payload = gzip.decompress(payload)
+        _bucket.update(response.headers)
+
+        if response.status != 429:
+            return response.status, response.headers, payload
+
+        # Throttled: honor Retry-After, then retry the call
+        try:
+            retry_after = max(1, int(response.headers.get('Retry-After', 1)))
+        except (TypeError, ValueError):
+            retry_after = 1
+        time.sleep(retry_after)
+
+
+# Persistent ETag cache for conditional GETs. Unchanged resources answer
+# with an empty 304 instead of re-sending (and server-side re-computing)
+# the full body, and the cache survives across CLI invocations.
+_ETAG_PATH = Path.home() / '.cache' / 'jira-skills' / 'etags.json'
+
+_etags = None
+_etag_lock = threading.Lock()
+
+
+def _load_etags():
+    global _etags
+    if _etags is None:
+        try:
+            _etags = _json_loads(_ETAG_PATH.read_bytes())
+        except (OSError, ValueError):
+            _etags = {}
+    return _etags
+
+
+def _save_etags():
+    try:
+        _ETAG_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _ETAG_PATH.write_bytes(_json_dumps(_etags))
+    except OSError:
+        pass  # Cache is best-effort
+
+
+def cached_get(path, api_root='/rest/api/3'):
+    """GET with a persistent ETag cache (If-None-Match revalidation).
+
+    Sends the cached ETag for URLs seen before; a 304 reply reuses the
+    cached body, skipping the re-download and the JSON parse. Responses
+    without an ETag header behave exactly like make_request('GET', ...).
+    """
+    url = f'{api_root}{path}'
+    with _etag_lock:
+        entry = _load_etags().get(url)
+
+    conditional = {'If-None-Match': entry['etag']} if entry else None
+    status, headers, payload = raw_request('GET', path, api_root=api_root,
+                                           headers=conditional)
+
+    if status == 304 and entry:
+        return entry['body']
+
+    if status >= 400:
+        raise Exception(f'{status}: {payload[:200].decode("utf-8", "replace")}')
+
+    if status in (202, 204):
+        return None
+
+    body = _json_loads(payload)
+    etag = headers.get('ETag')
+    if etag:
+        with _etag_lock:
+            _load_etags()[url] = {'etag': etag, 'body': body}
+            _save_etags()
+    return body
+
+
+def make_request(method, path, data=None, api_root='/rest/api/3',
+                 verbose=False, ignore_404=False):
+    """Make HTTP request to the Jira API over a persistent keep-alive connection.
+
+    Args:
+        method: HTTP method (GET, POST, PUT, DELETE)
+        path: API path (e.g. '/issue')
+        data: Request body as dict (will be JSON encoded)
+        api_root: URL prefix, defaults to REST API v3
+        verbose: Print request/response lines (used by the auth test suite)
+        ignore_404: Return None on 404 instead of raising
+
+    Returns:
+        Parsed JSON response or None for 202/204 (and ignored 404) responses
+
+    Raises:
+        Exception with error details on failure
+    """
+    if verbose:
+        print(f'\nRequest: {method} {JIRA_BASE_URL}{api_root}{path}')
+
+    status, _, payload = raw_request(method, path, data, api_root=api_root)
+
+    if ignore_404 and status == 404:
+        if verbose:
+            print(f'Response: {status} (ignored)')
+        return None
+
+    if status >= 400:
+        if verbose:
+            print(f'Response: {status} Error')
+        raise Exception(f'{status}: {payload[:200].decode("utf-8", "replace")}')
+
+    if verbose:
+        print(f'Response: {status} OK')
+
+    if status in (202, 204):
+        return None
+    return _json_loads(payload)
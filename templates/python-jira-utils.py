@@ -11,22 +11,54 @@ This template provides:
 - Common issue creation patterns
 """
 
-import base64
+import binascii
+import http.client
 import json
 import os
+import re
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from urllib.request import Request, urlopen
-from urllib.error import HTTPError
+from types import SimpleNamespace
+from urllib.parse import urlencode, urlsplit
+
+# orjson serializes and parses several times faster than stdlib json and
+# works on bytes directly (no encode/decode round trip); fall back to the
+# stdlib when it is not installed.
+try:
+    import orjson
+
+    def _json_dumps(data):
+        return orjson.dumps(data)
+
+    def _json_loads(payload):
+        return orjson.loads(payload)
+except ImportError:
+    def _json_dumps(data):
+        return json.dumps(data).encode('utf-8')
+
+    def _json_loads(payload):
+        return json.loads(payload.decode('utf-8'))
 
 
 # ====================
 # ENVIRONMENT LOADING
 # ====================
 
+# Matches KEY=VALUE lines (comments excluded) so the whole .env file is
+# parsed in one C-level regex pass instead of per-line string ops
+_ENV_RE = re.compile(r'(?m)^[ \t]*(?!#)([A-Za-z_][A-Za-z0-9_]*)[ \t]*=[ \t]*(.*?)[ \t]*$')
+
+
+@lru_cache(maxsize=None)
 def load_env(levels_up=2):
     """Load environment variables from .env file.
 
+    Memoized per levels_up, so repeated calls (re-imports, REPL or test
+    harness use) parse the file only once per process.
+
     Args:
         levels_up: Number of directory levels to traverse up from script location
                    to find .env file. Default is 2 (scripts/ -> skill/ -> jira/)
@@ -36,18 +68,24 @@ def load_env(levels_up=2):
         env_path = env_path.parent
     env_path = env_path / '.env'
 
-    if env_path.exists():
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    os.environ.setdefault(key.strip(), value.strip())
+    # EAFP: read directly instead of paying a separate exists() stat.
+    # read_bytes hits the single-read fast path (no TextIOWrapper or
+    # incremental decoder for a file this small).
+    try:
+        text = env_path.read_bytes().decode('utf-8', 'replace')
+    except FileNotFoundError:
+        return
+    for key, value in _ENV_RE.findall(text):
+        os.environ.setdefault(key, value)
 
 
+@lru_cache(maxsize=1)
 def get_config():
     """Get Jira configuration from environment variables.
 
+    Memoized: the environment is read once per process and later calls
+    return the same dict, so treat it as read-only.
+
     Returns:
         dict with email, token, base_url, project_key
 
@@ -57,7 +95,9 @@ def get_config():
     config = {
         'email': os.environ.get('JIRA_EMAIL'),
         'token': os.environ.get('JIRA_API_TOKEN'),
-        'base_url': os.environ.get('JIRA_BASE_URL'),
+        # Normalized once here so a trailing slash in .env can't produce
+        # double-slash URLs at every call site
+        'base_url': (os.environ.get('JIRA_BASE_URL') or '').rstrip('/') or None,
         'project_key': os.environ.get('JIRA_PROJECT_KEY', 'SCRUM'),
         'board_id': os.environ.get('JIRA_BOARD_ID', '1')
     }
@@ -71,9 +111,14 @@ def get_config():
     return config
 
 
+@lru_cache(maxsize=4)
 def get_auth_headers(email, token):
     """Build authentication headers for Jira API.
 
+    Memoized so the base64 encoding and dict construction happen once
+    per credential pair; callers share the returned dict, so treat it
+    as read-only.
+
     Args:
         email: Jira account email
         token: Jira API token
@@ -81,29 +126,65 @@ def get_auth_headers(email, token):
     Returns:
         dict of headers including Authorization
     """
-    auth_string = f'{email}:{token}'
-    auth_bytes = base64.b64encode(auth_string.encode('utf-8')).decode('utf-8')
+    # ASCII-only credentials; b2a_base64 is the thin C primitive under
+    # b64encode. Stay in bytes end to end: no intermediate f-string and
+    # no decode, since http.client sends bytes header values as-is.
+    auth = binascii.b2a_base64(
+        email.encode('ascii') + b':' + token.encode('ascii'), newline=False)
 
     return {
-        'Authorization': f'Basic {auth_bytes}',
+        'Authorization': b'Basic ' + auth,
         'Content-Type': 'application/json',
         'Accept': 'application/json'
     }
 
 
+@lru_cache(maxsize=1)
+def default_headers():
+    """Auth headers for the configured account, built once per process.
+
+    Returns:
+        The shared headers dict for the credentials in the environment
+    """
+    config = get_config()
+    return get_auth_headers(config['email'], config['token'])
+
+
 # ====================
 # JIRA API REQUESTS
 # ====================
 
-def jira_request(base_url, headers, path, method='GET', data=None):
-    """Make HTTP request to Jira REST API v3.
+# Last seen ETag and parsed body per GET URL. Conditional requests let
+# the server answer an unchanged resource with an empty 304, skipping the
+# re-download and re-parse for hot issue lookups.
+_etag_cache = {}
+
+# One persistent keep-alive connection per thread, opened on the first
+# request and reused across calls; avoids a TCP+TLS handshake per call,
+# and thread-locality keeps the concurrent helpers safe.
+_local = threading.local()
+
+
+def _connect(base_url):
+    conn = getattr(_local, 'connection', None)
+    if conn is None:
+        host = urlsplit(base_url).netloc
+        conn = http.client.HTTPSConnection(host, timeout=30)
+        _local.connection = conn
+    return conn
+
+
+def _do_request(api_root, base_url, headers, path, method='GET', data=None):
+    """Make HTTP request to a Jira REST API over the persistent connection.
 
     Args:
+        api_root: API prefix ('/rest/api/3' or '/rest/agile/1.0')
         base_url: Jira instance URL (e.g., https://company.atlassian.net)
         headers: Authentication headers
         path: API path (e.g., '/issue')
         method: HTTP method (GET, POST, PUT, DELETE)
-        data: Request body as dict (will be JSON encoded)
+        data: Request body as dict (JSON encoded), or pre-encoded bytes
+            sent as-is
 
     Returns:
         Parsed JSON response or None for 204 responses
@@ -111,44 +192,99 @@ def jira_request(base_url, headers, path, method='GET', data=None):
     Raises:
         Exception with error details on failure
     """
-    url = f'{base_url}/rest/api/3{path}'
-    body = json.dumps(data).encode('utf-8') if data else None
-    req = Request(url, data=body, headers=headers, method=method)
-
-    try:
-        with urlopen(req) as response:
-            if response.status == 204:
-                return None
-            return json.loads(response.read().decode('utf-8'))
-    except HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        raise Exception(f'{e.code}: {error_body[:300]}')
-
-
-def jira_agile_request(base_url, headers, path, method='GET', data=None):
-    """Make HTTP request to Jira Agile API v1.0.
+    url = f'{api_root}{path}'
+    if isinstance(data, bytes):
+        body = data
+    else:
+        body = _json_dumps(data) if data else None
+
+    entry = _etag_cache.get(url) if method == 'GET' else None
+    if entry:
+        headers = {**headers, 'If-None-Match': entry[0]}
+
+    for attempt in (1, 2):
+        conn = _connect(base_url)
+        try:
+            conn.request(method, url, body=body, headers=headers)
+            response = conn.getresponse()
+            break
+        except (http.client.HTTPException, OSError):
+            # Server closed the idle connection; reconnect and retry once
+            conn.close()
+            _local.connection = None
+            if attempt == 2:
+                raise
+
+    payload = response.read()
+    if response.status == 304 and entry:
+        return entry[1]
+    if response.status >= 400:
+        # Decode only the reported prefix; error bodies can be large HTML
+        raise Exception(f'{response.status}: {payload[:300].decode("utf-8", "replace")}')
+    if response.status == 204:
+        return None
+
+    parsed = _json_loads(payload)
+    if method == 'GET':
+        etag = response.headers.get('ETag')
+        if etag:
+            _etag_cache[url] = (etag, parsed)
+    return parsed
+
+
+# The REST v3 and Agile v1.0 helpers share the logic above and differ
+# only in the API prefix
+jira_request = partial(_do_request, '/rest/api/3')
+jira_agile_request = partial(_do_request, '/rest/agile/1.0')
+
+
+def parallel_requests(base_url, headers, paths, max_workers=8):
+    """Fetch several independent API paths concurrently.
+
+    Network round trips dominate these scripts, so overlapping
+    independent GETs cuts wall time to roughly the slowest response.
+    Uses a small thread pool over the stdlib client (the calls release
+    the GIL while blocked on the socket).
 
     Args:
-        Same as jira_request but uses /rest/agile/1.0 base path
+        base_url: Jira instance URL
+        headers: Authentication headers
+        paths: List of API paths (e.g., ['/myself', '/project/SCRUM'])
+        max_workers: Upper bound on concurrent requests
+
+    Returns:
+        List of parsed responses in the same order as paths
     """
-    url = f'{base_url}/rest/agile/1.0{path}'
-    body = json.dumps(data).encode('utf-8') if data else None
-    req = Request(url, data=body, headers=headers, method=method)
+    if not paths:
+        return []
 
-    try:
-        with urlopen(req) as response:
-            if response.status == 204:
-                return None
-            return json.loads(response.read().decode('utf-8'))
-    except HTTPError as e:
-        error_body = e.read().decode('utf-8')
-        raise Exception(f'{e.code}: {error_body[:300]}')
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        futures = [executor.submit(jira_request, base_url, headers, path)
+                   for path in paths]
+        return [future.result() for future in futures]
 
 
 # ====================
 # ADF BUILDER
 # ====================
 
+# ADF node type values recur once per node in large documents; interning
+# them makes every node share a single string object, which keeps dict-key
+# hashing and serialization from re-scanning duplicate strings
+_T_DOC = sys.intern('doc')
+_T_TEXT = sys.intern('text')
+_T_HEADING = sys.intern('heading')
+_T_PARAGRAPH = sys.intern('paragraph')
+_T_BULLET_LIST = sys.intern('bulletList')
+_T_LIST_ITEM = sys.intern('listItem')
+_T_CODE_BLOCK = sys.intern('codeBlock')
+
+
+def _text(text):
+    """Minimal ADF text node; hoisted out of build_adf's per-node literals."""
+    return {'type': _T_TEXT, 'text': text}
+
+
 def build_adf(sections):
     """Build Atlassian Document Format (ADF) from sections.
 
@@ -180,24 +316,24 @@ def build_adf(sections):
     for section in sections:
         if 'heading' in section:
             content.append({
-                'type': 'heading',
+                'type': _T_HEADING,
                 'attrs': {'level': section.get('level', 2)},
-                'content': [{'type': 'text', 'text': section['heading']}]
+                'content': [_text(section['heading'])]
             })
 
         if 'paragraph' in section:
             content.append({
-                'type': 'paragraph',
-                'content': [{'type': 'text', 'text': section['paragraph']}]
+                'type': _T_PARAGRAPH,
+                'content': [_text(section['paragraph'])]
             })
 
         if 'bullets' in section:
             content.append({
-                'type': 'bulletList',
+                'type': _T_BULLET_LIST,
                 'content': [
                     {
-                        'type': 'listItem',
-                        'content': [{'type': 'paragraph', 'content': [{'type': 'text', 'text': bullet}]}]
+                        'type': _T_LIST_ITEM,
+                        'content': [{'type': _T_PARAGRAPH, 'content': [_text(bullet)]}]
                     }
                     for bullet in section['bullets']
                 ]
@@ -205,17 +341,22 @@ def build_adf(sections):
 
         if 'code' in section:
             content.append({
-                'type': 'codeBlock',
+                'type': _T_CODE_BLOCK,
                 'attrs': {'language': section.get('language', 'text')},
-                'content': [{'type': 'text', 'text': section['code']}]
+                'content': [_text(section['code'])]
             })
 
-    return {'type': 'doc', 'version': 1, 'content': content}
+    return {'type': _T_DOC, 'version': 1, 'content': content}
 
 
+@lru_cache(maxsize=256)
 def simple_adf(text):
     """Create simple ADF with just a paragraph.
 
+    Memoized: bulk generators reuse the same boilerplate text across
+    many issues, and the document is only ever serialized, so repeats
+    share one cached dict. Treat the returned dict as read-only.
+
     Args:
         text: Plain text string
 
@@ -223,12 +364,12 @@ def simple_adf(text):
         ADF document with single paragraph
     """
     return {
-        'type': 'doc',
+        'type': _T_DOC,
         'version': 1,
         'content': [
             {
-                'type': 'paragraph',
-                'content': [{'type': 'text', 'text': text}]
+                'type': _T_PARAGRAPH,
+                'content': [_text(text)]
             }
         ]
     }
@@ -238,6 +379,19 @@ def simple_adf(text):
 # ISSUE CREATION
 # ====================
 
+# Shared, read-only field fragments: the serializer only reads them, so
+# every create call can reference the same dicts instead of rebuilding them
+_TYPE_EPIC = {'name': 'Epic'}
+_TYPE_STORY = {'name': 'Story'}
+_TYPE_SUBTASK = {'name': 'Subtask'}  # Next-Gen (no hyphen)
+
+
+@lru_cache(maxsize=8)
+def _project_ref(project_key):
+    """Shared {'key': ...} project reference; treat as read-only."""
+    return {'key': project_key}
+
+
 def create_epic(base_url, headers, project_key, summary, description_sections):
     """Create an Epic issue.
 
@@ -252,8 +406,8 @@ def create_epic(base_url, headers, project_key, summary, description_sections):
         Created issue response
     """
     fields = {
-        'project': {'key': project_key},
-        'issuetype': {'name': 'Epic'},
+        'project': _project_ref(project_key),
+        'issuetype': _TYPE_EPIC,
         'summary': summary,
         'description': build_adf(description_sections)
     }
@@ -276,8 +430,8 @@ def create_story(base_url, headers, project_key, summary, description_sections,
         Created issue response
     """
     fields = {
-        'project': {'key': project_key},
-        'issuetype': {'name': 'Story'},
+        'project': _project_ref(project_key),
+        'issuetype': _TYPE_STORY,
         'summary': summary,
         'description': build_adf(description_sections)
     }
@@ -291,6 +445,14 @@ def create_story(base_url, headers, project_key, summary, description_sections,
     return jira_request(base_url, headers, '/issue', method='POST', data={'fields': fields})
 
 
+# The subtask body shape is fixed, so high-volume creation formats a
+# prebuilt byte template instead of building dicts and walking the full
+# serializer per issue; only the three dynamic strings are JSON-escaped
+_SUBTASK_TMPL = (b'{"fields":{"project":{"key":%b},'
+                 b'"issuetype":{"name":"Subtask"},'
+                 b'"parent":{"key":%b},"summary":%b}}')
+
+
 def create_subtask(base_url, headers, project_key, parent_key, summary):
     """Create a Subtask under a parent Story.
 
@@ -307,13 +469,61 @@ def create_subtask(base_url, headers, project_key, parent_key, summary):
     Returns:
         Created issue response
     """
-    fields = {
-        'project': {'key': project_key},
-        'issuetype': {'name': 'Subtask'},  # Next-Gen
-        'parent': {'key': parent_key},
-        'summary': summary
-    }
-    return jira_request(base_url, headers, '/issue', method='POST', data={'fields': fields})
+    body = _SUBTASK_TMPL % (_json_dumps(project_key), _json_dumps(parent_key),
+                            _json_dumps(summary))
+    return jira_request(base_url, headers, '/issue', method='POST', data=body)
+
+
+def create_subtasks_parallel(base_url, headers, project_key, parent_key,
+                             summaries, workers=8):
+    """Create subtasks under one parent concurrently.
+
+    For cases the bulk endpoint doesn't fit, the per-issue POSTs are
+    independent and network-bound, so a bounded thread pool cuts wall
+    time near-linearly with workers. Each worker thread reuses its own
+    keep-alive connection.
+
+    Args:
+        base_url: Jira instance URL
+        headers: Auth headers
+        project_key: Project key
+        parent_key: Parent Story key
+        summaries: List of subtask titles
+        workers: Upper bound on concurrent requests
+
+    Returns:
+        List of created issue responses, in summaries order
+    """
+    if not summaries:
+        return []
+
+    with ThreadPoolExecutor(max_workers=min(workers, len(summaries))) as executor:
+        return list(executor.map(
+            lambda summary: create_subtask(base_url, headers, project_key,
+                                           parent_key, summary),
+            summaries))
+
+
+def create_issues_bulk(base_url, headers, issue_updates):
+    """Create many issues in one POST to /issue/bulk.
+
+    One bulk round trip replaces N single-issue POSTs, so building a
+    whole backlog (epic plus stories plus subtasks) as a flat list of
+    field dicts and flushing it here is far faster than calling the
+    create_* helpers in a loop. Jira accepts up to 50 entries per call.
+
+    Args:
+        base_url: Jira instance URL
+        headers: Auth headers
+        issue_updates: List of {'fields': {...}} dicts, as accepted by
+            the single-issue create endpoints (max 50 per call)
+
+    Returns:
+        Bulk response with 'issues' and 'errors' arrays; each error
+        carries failedElementNumber indexing into issue_updates
+    """
+    return jira_request(base_url, headers, '/issue/bulk', method='POST',
+                        data={'issueUpdates': issue_updates})
 
 
 # ====================
@@ -334,13 +544,53 @@ def get_issue(base_url, headers, issue_key, fields=None):
     """
     path = f'/issue/{issue_key}'
     if fields:
-        path += f'?fields={fields}'
+        # urlencode escapes characters like '*' and spaces that would
+        # otherwise produce a malformed URL and a wasted round trip
+        path += '?' + urlencode({'fields': fields})
     return jira_request(base_url, headers, path)
 
 
+def iter_issues(base_url, headers, jql, fields=None, page_size=100):
+    """Stream issues matching a JQL query, following pagination.
+
+    Uses the enhanced /search/jql endpoint, which pages with an opaque
+    nextPageToken cursor and only returns the requested fields
+    server-side. Issues are yielded one page at a time, so arbitrarily
+    large result sets never materialize as one list.
+
+    Args:
+        base_url: Jira instance URL
+        headers: Auth headers
+        jql: JQL query string
+        fields: Optional list of field names to return
+        page_size: Issues per page (the server caps pages at 100)
+
+    Yields:
+        Issue dicts as returned by the API
+    """
+    next_page_token = None
+
+    while True:
+        params = {'jql': jql, 'maxResults': page_size}
+        if fields:
+            params['fields'] = ','.join(fields)
+        if next_page_token:
+            params['nextPageToken'] = next_page_token
+
+        result = jira_request(base_url, headers, f'/search/jql?{urlencode(params)}')
+        yield from result.get('issues', [])
+
+        next_page_token = result.get('nextPageToken')
+        if not next_page_token:
+            return
+
+
 def search_issues(base_url, headers, jql, fields=None, max_results=50):
     """Search issues using JQL.
 
+    Thin wrapper over iter_issues for callers that want a bounded list;
+    prefer iter_issues when processing results incrementally.
+
     Args:
         base_url: Jira instance URL
         headers: Auth headers
@@ -351,14 +601,14 @@ def search_issues(base_url, headers, jql, fields=None, max_results=50):
     Returns:
         Search results with issues array
     """
-    data = {
-        'jql': jql,
-        'maxResults': max_results
-    }
-    if fields:
-        data['fields'] = fields
+    issues = []
+    for issue in iter_issues(base_url, headers, jql, fields=fields,
+                             page_size=min(max_results, 100)):
+        issues.append(issue)
+        if len(issues) >= max_results:
+            break
 
-    return jira_request(base_url, headers, '/search', method='POST', data=data)
+    return {'issues': issues}
 
 
 def delete_issue(base_url, headers, issue_key):
@@ -372,6 +622,45 @@ def delete_issue(base_url, headers, issue_key):
     return jira_request(base_url, headers, f'/issue/{issue_key}', method='DELETE')
 
 
+def make_client(config=None):
+    """Bind the helpers to the configured instance and project once.
+
+    Scripts that only ever target one project thread base_url, headers,
+    and project_key through every call; closing over them here removes
+    that per-call plumbing and shortens every call site.
+
+    Args:
+        config: Config dict from get_config(); loaded from the
+            environment when omitted
+
+    Returns:
+        SimpleNamespace whose methods take only the varying arguments,
+        e.g. client.create_story(summary, sections) or
+        client.get_issue('SCRUM-1', fields='summary,status')
+    """
+    if config is None:
+        load_env()
+        config = get_config()
+
+    base_url = config['base_url']
+    headers = get_auth_headers(config['email'], config['token'])
+    project_key = config['project_key']
+
+    return SimpleNamespace(
+        create_epic=partial(create_epic, base_url, headers, project_key),
+        create_story=partial(create_story, base_url, headers, project_key),
+        create_subtask=partial(create_subtask, base_url, headers, project_key),
+        create_subtasks_parallel=partial(create_subtasks_parallel, base_url,
+                                         headers, project_key),
+        create_issues_bulk=partial(create_issues_bulk, base_url, headers),
+        get_issue=partial(get_issue, base_url, headers),
+        search_issues=partial(search_issues, base_url, headers),
+        iter_issues=partial(iter_issues, base_url, headers),
+        delete_issue=partial(delete_issue, base_url, headers),
+        request=partial(jira_request, base_url, headers),
+    )
+
+
 # ====================
 # EXAMPLE USAGE
 # ====================